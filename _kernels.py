@@ -0,0 +1,46 @@
+# _kernels.py
+#
+# Numba AOT 컴파일 스크립트. `python _kernels.py`를 실행하면 trader_kernels
+# 공유 라이브러리(.so/.pyd)가 생성되고, auto_trader가 이를 import해서 사용한다.
+# (JIT 방식에서 첫 호출 때 발생하는 수 초의 컴파일 지연을 설치 시점으로 이동)
+#
+# 주의: numba.pycc는 0.57부터 deprecated, 0.62에서 제거됨.
+# requirement.txt에서 numba<0.62로 고정되어 있으며, 그 이후 버전에서는
+# 이 스크립트 대신 auto_trader의 @njit 폴백 커널이 사용된다.
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC("trader_kernels")
+
+_TICK_THRESH = np.array(
+    [0, 1_000, 10_000, 100_000, 500_000, 1_000_000, 2_000_000], dtype=np.float64
+)
+_TICK_SIZE = np.array([1, 5, 10, 50, 100, 500, 1000], dtype=np.float64)
+
+
+@cc.export("ma5_ma20_last", "UniTuple(f8, 2)(f8[:])")
+def ma5_ma20_last(close):
+    """마지막 MA5/MA20을 배열 한 번 순회로 동시에 계산 (커널 융합)"""
+    n = len(close)
+    s5 = 0.0
+    s20 = 0.0
+    for i in range(n - 20, n):
+        s20 += close[i]
+        if i >= n - 5:
+            s5 += close[i]
+    return s5 / 5.0, s20 / 20.0
+
+
+@cc.export("adjust_tick", "f8(f8)")
+def adjust_tick(price):
+    """가격을 업비트 호가단위에 맞게 보정"""
+    tick = _TICK_SIZE[0]
+    for i in range(len(_TICK_THRESH)):
+        if price >= _TICK_THRESH[i]:
+            tick = _TICK_SIZE[i]
+    return round(price / tick) * tick
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,20 +1,47 @@
 # auto_trader.py
 
 import os
+import re
 import time
+import queue
+import atexit
+import bisect
+import asyncio
+import logging
+import logging.handlers
 import sqlite3
+import threading
 from datetime import datetime
 
 import schedule  # <= 새로 추가
+import httpx
 import pyupbit
 import openai
+import numpy as np
 import pandas as pd
+from numba import njit
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 
 load_dotenv()
 
+# -----------------------------------------------------------------------------
+# 0. 로깅 설정: 핫패스는 큐에 넣기만 하고, 실제 파일/콘솔 I/O는 리스너 스레드가 수행
+# -----------------------------------------------------------------------------
+_log_record_queue = queue.SimpleQueue()
+logger = logging.getLogger("auto_trader")
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(_log_record_queue))
+
+_file_handler = logging.FileHandler("trader.log", encoding="utf-8")
+_file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+_log_listener = logging.handlers.QueueListener(
+    _log_record_queue, logging.StreamHandler(), _file_handler
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # -----------------------------------------------------------------------------
 # 1. 환경변수에서 API 키 로드
 # -----------------------------------------------------------------------------
@@ -26,16 +53,49 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 upbit = pyupbit.Upbit(UPBIT_ACCESS_KEY, UPBIT_SECRET_KEY)
 openai.api_key = OPENAI_API_KEY
 
+# OpenAI 비동기 클라이언트 (모듈 레벨 싱글톤, keep-alive 커넥션 재사용)
+_openai_client = AsyncOpenAI(
+    api_key=OPENAI_API_KEY,
+    http_client=httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20)
+    ),
+)
+
+# 비동기 호출 전용 이벤트 루프: asyncio.run은 호출마다 루프를 새로 만들고 닫아서
+# keep-alive 커넥션이 닫힌 루프에 묶이므로, 상시 실행되는 루프 하나에 코루틴을 제출한다.
+_async_loop = asyncio.new_event_loop()
+threading.Thread(target=_async_loop.run_forever, daemon=True).start()
+
+def run_async(coro, timeout=None):
+    """백그라운드 이벤트 루프에서 코루틴을 실행하고 결과를 반환"""
+    return asyncio.run_coroutine_threadsafe(coro, _async_loop).result(timeout)
+
+def _close_openai_client():
+    try:
+        asyncio.run_coroutine_threadsafe(
+            _openai_client.close(), _async_loop
+        ).result(timeout=5)
+    except Exception:
+        pass
+    _async_loop.call_soon_threadsafe(_async_loop.stop)
+
+atexit.register(_close_openai_client)
+
 # -----------------------------------------------------------------------------
 # 2. DB 초기화 및 매매 로그 저장 함수
 # -----------------------------------------------------------------------------
 def init_db(db_path="trade_log.db"):
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
     cur = conn.cursor()
+    # WAL 모드: 트랜잭션마다 저널 fsync 두 번 하던 것을 제거
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA cache_size=-20000")  # 20MB 페이지 캐시
     cur.execute("""
         CREATE TABLE IF NOT EXISTS trade_log (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            datetime TEXT,
+            datetime INTEGER,
             action TEXT,
             market TEXT,
             volume REAL,
@@ -43,180 +103,390 @@ def init_db(db_path="trade_log.db"):
             reason TEXT
         )
     """)
-    conn.commit()
+    _start_log_flusher(conn)
     return conn
 
+# 매매 로그는 큐에 쌓아두고 백그라운드 스레드가 모아서 한 번에 커밋 (핫패스에서 fsync 제거)
+# INSERT 문은 상수로 한 번만 정의 → SQLite 문장 캐시가 재파싱 없이 재사용
+_INSERT_SQL = """
+    INSERT INTO trade_log (datetime, action, market, volume, price, reason)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_log_queue = queue.Queue()
+_flusher_started = False
+
+def _log_flusher_loop(conn):
+    while True:
+        rows = []
+        try:
+            rows.append(_log_queue.get(timeout=1.0))
+            while len(rows) < 100:
+                rows.append(_log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not rows:
+            continue
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(_INSERT_SQL, rows)
+            conn.execute("COMMIT")
+        except Exception as e:
+            logger.error("매매 로그 저장 실패, 재시도 예정: %s", e)
+            # 열린 트랜잭션을 정리하지 않으면 다음 BEGIN이 계속 실패함
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            # 실패한 행은 다시 큐에 넣어 다음 사이클에 재시도
+            for row in rows:
+                _log_queue.put(row)
+            # 재큐한 행이 바로 다시 꺼내지며 전속력으로 도는 것을 방지 (디스크 장애 등 지속 실패 대비)
+            time.sleep(1)
+
+def _start_log_flusher(conn):
+    global _flusher_started
+    if _flusher_started:
+        return
+    _flusher_started = True
+    t = threading.Thread(target=_log_flusher_loop, args=(conn,), daemon=True)
+    t.start()
+
 def insert_trade_log(conn, action, market, volume, price, reason):
-    cur = conn.cursor()
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    cur.execute("""
-        INSERT INTO trade_log (datetime, action, market, volume, price, reason)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (now, action, market, volume, price, reason))
-    conn.commit()
+    # 삽입 경로에서는 epoch 밀리초만 기록하고, 문자열 변환은 조회할 때 수행
+    now_ms = time.time_ns() // 1_000_000
+    _log_queue.put((now_ms, action, market, volume, price, reason))
+
+def format_trade_time(value) -> str:
+    """trade_log의 datetime 값을 표시용 문자열로 변환
+
+    새 행은 epoch 밀리초(정수)로 저장되지만, 기존 DB의 TEXT 컬럼에는
+    "YYYY-mm-dd HH:MM:SS" 문자열 행과 문자열로 저장된 밀리초가 섞여 있다.
+    """
+    try:
+        ms = int(value)
+    except (TypeError, ValueError):
+        return str(value)  # 기존 텍스트 타임스탬프는 그대로 반환
+    return datetime.fromtimestamp(ms / 1000).strftime("%Y-%m-%d %H:%M:%S")
 
 # -----------------------------------------------------------------------------
 # 3. Upbit API 함수들 (시세 조회, 매수, 매도)
 # -----------------------------------------------------------------------------
+# 웹소켓으로 받은 최신 체결가 캐시 (REST 폴링 대신 푸시 방식)
+_latest_tick = {}
+_tick_lock = threading.Lock()
+
+def _ws_ticker_loop(market: str):
+    """웹소켓 ticker 피드를 계속 수신해서 _latest_tick에 저장하는 백그라운드 루프"""
+    while True:
+        wm = None
+        try:
+            wm = pyupbit.WebSocketManager("ticker", [market])
+            while True:
+                data = wm.get()
+                if data is None:
+                    break
+                with _tick_lock:
+                    _latest_tick[market] = data
+        except Exception as e:
+            logger.error("웹소켓 수신 실패, 재접속 시도: %s", e)
+            time.sleep(1)
+        finally:
+            # WebSocketManager는 자식 프로세스라서 종료하지 않으면 재접속마다 누수됨
+            if wm is not None:
+                try:
+                    wm.terminate()
+                except Exception:
+                    pass
+
+def start_ticker_feed(market: str = "KRW-BTC"):
+    t = threading.Thread(target=_ws_ticker_loop, args=(market,), daemon=True)
+    t.start()
+    return t
+
 def get_current_price(market: str = "KRW-BTC"):
+    # 웹소켓 캐시에 최신 틱이 있으면 REST 호출 없이 바로 사용
+    with _tick_lock:
+        tick = _latest_tick.get(market)
+    if tick is not None:
+        return tick["trade_price"]
     try:
         return pyupbit.get_current_price(market)
     except Exception as e:
-        print(f"[오류] 현재가 조회 실패: {e}")
+        logger.error("현재가 조회 실패: %s", e)
         return None
 
 def buy_coin(market: str, price: float, volume: float):
     try:
         order = upbit.buy_limit_order(market, price, volume)
-        print("[매수 요청]", order)
+        logger.info("매수 요청: %s", order)
         return order
     except Exception as e:
-        print(f"[오류] 매수 실패: {e}")
+        logger.error("매수 실패: %s", e)
         return None
 
 def sell_coin(market: str, price: float, volume: float):
     try:
         order = upbit.sell_limit_order(market, price, volume)
-        print("[매도 요청]", order)
+        logger.info("매도 요청: %s", order)
         return order
     except Exception as e:
-        print(f"[오류] 매도 실패: {e}")
+        logger.error("매도 실패: %s", e)
+        return None
+
+def cancel_order(uuid: str):
+    try:
+        result = upbit.cancel_order(uuid)
+        logger.info("주문 취소: %s", result)
+        return result
+    except Exception as e:
+        logger.error("주문 취소 실패: %s", e)
         return None
 
 def get_balances():
     try:
         return upbit.get_balances()
     except Exception as e:
-        print(f"[오류] 잔고 조회 실패: {e}")
+        logger.error("잔고 조회 실패: %s", e)
         return None
 
 # -----------------------------------------------------------------------------
 # 4. 과거 데이터 조회 & 간단한 분석 예시
 # -----------------------------------------------------------------------------
-def get_historical_data(market="KRW-BTC", interval="day", count=200):
-    return pyupbit.get_ohlcv(market, interval=interval, count=count)
-
-def simple_analysis(df: pd.DataFrame):
-    df["ma5"] = df["close"].rolling(window=5).mean()
-    df["ma20"] = df["close"].rolling(window=20).mean()
+# OHLCV 캐시: 캔들은 봉 하나만 바뀌므로 전체 재조회 대신 최신 2개만 받아서 갱신
+_OHLCV_CACHE = {}  # (market, interval) -> (조회 시각, DataFrame)
+
+_INTERVAL_SECONDS = {
+    "day": 86_400,
+    "week": 604_800,
+    "minute1": 60,
+    "minute3": 180,
+    "minute5": 300,
+    "minute10": 600,
+    "minute15": 900,
+    "minute30": 1_800,
+    "minute60": 3_600,
+    "minute240": 14_400,
+}
 
-    last_ma5 = df["ma5"].iloc[-1]
-    last_ma20 = df["ma20"].iloc[-1]
+def get_historical_data(market="KRW-BTC", interval="day", count=200):
+    key = (market, interval)
+    cached = _OHLCV_CACHE.get(key)
+    now = datetime.now()
+
+    if cached is not None and len(cached[1]) >= count:
+        ts, df = cached
+        age = (now - ts).total_seconds()
+        if age < _INTERVAL_SECONDS.get(interval, 86_400):
+            # 같은 봉 안이면 현재 봉 2개만 받아서 마지막 행 교체/추가
+            delta = pyupbit.get_ohlcv(market, interval=interval, count=2)
+            if delta is not None and len(delta) > 0:
+                df = pd.concat([df[~df.index.isin(delta.index)], delta])
+                _OHLCV_CACHE[key] = (now, df)
+            _sync_closes(df)
+            return df.tail(count)
+
+    df = pyupbit.get_ohlcv(market, interval=interval, count=count)
+    if df is not None:
+        _OHLCV_CACHE[key] = (now, df)
+        _sync_closes(df)
+    return df
+
+try:
+    # AOT 컴파일된 커널이 있으면 사용 (`python _kernels.py`로 빌드, 첫 호출 JIT 지연 없음)
+    from trader_kernels import ma5_ma20_last, adjust_tick as _aot_adjust_tick
+except ImportError:
+    _aot_adjust_tick = None
+
+    @njit(cache=True, fastmath=True)
+    def ma5_ma20_last(close: np.ndarray):
+        """마지막 MA5/MA20을 배열 한 번 순회로 동시에 계산 (커널 융합)"""
+        n = len(close)
+        s5 = 0.0
+        s20 = 0.0
+        for i in range(n - 20, n):
+            s20 += close[i]
+            if i >= n - 5:
+                s5 += close[i]
+        return s5 / 5.0, s20 / 20.0
+
+# 종가 링 버퍼: 장기 실행 시 조회마다 새 배열을 할당하지 않도록 미리 확보해 두고 재사용
+_CLOSES_CAP = 512
+_CLOSES = np.empty(_CLOSES_CAP, dtype=np.float64)
+_CLOSES_HEAD = 0  # 다음에 쓸 위치
+_CLOSES_LEN = 0
+_CLOSES_LAST_IDX = None  # 마지막으로 기록한 캔들의 타임스탬프
+
+def _sync_closes(df: pd.DataFrame):
+    """조회된 캔들 중 새 것만 링 버퍼에 밀어 넣고, 진행 중인 캔들은 제자리 갱신"""
+    global _CLOSES_HEAD, _CLOSES_LEN, _CLOSES_LAST_IDX
+    if df is None or len(df) == 0:
+        return
+    closes = df["close"].to_numpy(dtype=np.float64)
+    if _CLOSES_LAST_IDX is None:
+        new_closes = closes
+    else:
+        mask = df.index > _CLOSES_LAST_IDX
+        new_closes = closes[mask.to_numpy() if hasattr(mask, "to_numpy") else mask]
+        # 진행 중인 마지막 캔들은 같은 타임스탬프로 다시 오므로 제자리에서 덮어씀
+        if _CLOSES_LEN > 0 and _CLOSES_LAST_IDX in df.index:
+            pos = df.index.get_loc(_CLOSES_LAST_IDX)
+            _CLOSES[(_CLOSES_HEAD - 1) % _CLOSES_CAP] = closes[pos]
+    for v in new_closes[-_CLOSES_CAP:]:
+        _CLOSES[_CLOSES_HEAD] = v
+        _CLOSES_HEAD = (_CLOSES_HEAD + 1) % _CLOSES_CAP
+        _CLOSES_LEN = min(_CLOSES_LEN + 1, _CLOSES_CAP)
+    _CLOSES_LAST_IDX = df.index[-1]
+
+def recent_closes(n: int) -> np.ndarray:
+    """링 버퍼에서 최근 n개 종가를 시간순으로 반환 (랩어라운드가 없으면 뷰)"""
+    n = min(n, _CLOSES_LEN)
+    start = (_CLOSES_HEAD - n) % _CLOSES_CAP
+    if start + n <= _CLOSES_CAP:
+        return _CLOSES[start:start + n]
+    return np.concatenate((_CLOSES[start:], _CLOSES[:start + n - _CLOSES_CAP]))
+
+def simple_analysis(closes: np.ndarray):
+    # MA20 계산에 필요한 데이터가 없으면 시그널을 내지 않음
+    # (njit/AOT 커널은 경계 검사를 하지 않아 짧은 배열이 들어오면 안 됨)
+    if len(closes) < 20:
+        return None, float("nan"), float("nan")
+
+    last_ma5, last_ma20 = ma5_ma20_last(closes)
 
     if last_ma5 > last_ma20:
-        return "buy_signal"
+        return "buy_signal", last_ma5, last_ma20
     else:
-        return "sell_signal"
+        return "sell_signal", last_ma5, last_ma20
 
 # -----------------------------------------------------------------------------
 # 5. OpenAI API를 활용한 투자판단 보조 함수
 # -----------------------------------------------------------------------------
-def get_investment_opinion(data_summary: str):
-    prompt = f"""
-    다음은 비트코인 시장 데이터 요약입니다:
-    {data_summary}
-
-    - 최근 지표를 바탕으로, 현재 시점에서 매수/매도/홀딩 중 어느 것을 추천하고,
-      그 이유는 무엇인가?
-    """
-    client = OpenAI()
+# 프롬프트 템플릿 (모듈 상수): 장황한 설명 대신 작은 JSON 블롭 → 토큰 수 최소화
+_PROMPT_TMPL = (
+    "비트코인 시장 데이터입니다. 매수/매도/홀딩 중 하나를 추천하고 이유를 한두 문장으로 답하세요.\n"
+    '{{"recent_closes": [{closes}], "ma5": {ma5}, "ma20": {ma20}, '
+    '"signal": "{sig}", "price": {price}}}'
+)
+
+async def get_investment_opinion(closes, ma5, ma20, sig, price):
+    prompt = _PROMPT_TMPL.format(closes=closes, ma5=ma5, ma20=ma20, sig=sig, price=price)
     try:
-        response = client.chat.completions.create(
-            model="o1-mini",
+        response = await _openai_client.chat.completions.create(
+            model="gpt-4o-mini",
+            max_tokens=200,
             messages=[
                 {
                     "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": prompt
-                        }
-                    ]
+                    "content": prompt
                 }
             ]
         )
         return response.choices[0].message.content
     except Exception as e:
-        print("OpenAI API 호출 에러:", e)
+        logger.error("OpenAI API 호출 에러: %s", e)
         return None
 
 # -----------------------------------------------------------------------------
 # 5-1. 호가단위 보정 함수
 # -----------------------------------------------------------------------------
+# 가격대별 호가단위 테이블 (분기 대신 이진탐색 한 번으로 조회)
+_TICK_THRESH = (0, 1_000, 10_000, 100_000, 500_000, 1_000_000, 2_000_000)
+_TICK_SIZE = (1, 5, 10, 50, 100, 500, 1000)
+
 def adjust_price_to_tick(price: float):
-    if price >= 2_000_000:
-        return round(price / 1000) * 1000
-    elif price >= 1_000_000:
-        return round(price / 500) * 500
-    elif price >= 500_000:
-        return round(price / 100) * 100
-    elif price >= 100_000:
-        return round(price / 50) * 50
-    elif price >= 10_000:
-        return round(price / 10) * 10
-    elif price >= 1_000:
-        return round(price / 5) * 5
-    else:
-        return round(price)
+    if _aot_adjust_tick is not None:
+        return _aot_adjust_tick(price)
+    tick = _TICK_SIZE[bisect.bisect_right(_TICK_THRESH, price) - 1]
+    return round(price / tick) * tick
 
 # -----------------------------------------------------------------------------
 # 6. "한 번" 거래 실행하는 함수 (중요)
 # -----------------------------------------------------------------------------
-def trade_once(market="KRW-BTC", interval="day", count=30):
+def trade_once(conn, market="KRW-BTC", interval="day", count=30):
     """
     스케줄러에서 호출할 함수: 매매 로직을 한 번만 실행
+    (DB 커넥션은 main()에서 한 번만 열어서 재사용)
     """
     try:
-        conn = init_db("trade_log.db")
-
         df = get_historical_data(market, interval, count)
         current_price = get_current_price(market)
         if df is None or current_price is None:
-            print("[경고] 데이터 수집 실패, trade_once 종료")
+            logger.warning("데이터 수집 실패, trade_once 종료")
             return
 
-        signal = simple_analysis(df)
-
-        recent_closes = df["close"].tail(5).tolist()
-        last_ma5 = round(df["ma5"].iloc[-1], 2)
-        last_ma20 = round(df["ma20"].iloc[-1], 2)
-
-        summary_text = f"""
-        최근 종가 5개: {recent_closes}
-        5일 이평: {last_ma5}
-        20일 이평: {last_ma20}
-        분석 시그널: {signal}
-        현재가: {current_price}
-        """
-        ai_opinion = get_investment_opinion(summary_text)
-        if ai_opinion is None:
-            ai_opinion = "AI 의견 조회 실패"
-
-        print("\n----- AI Opinion -----\n", ai_opinion, "\n----------------------\n")
+        closes = recent_closes(count)
+        signal, last_ma5, last_ma20 = simple_analysis(closes)
+        if signal is None:
+            logger.warning("종가 데이터 부족 (%d개), trade_once 종료", len(closes))
+            return
 
-        # 간단한 매수/매도 로직
-        if "매수" in ai_opinion or "buy" in ai_opinion.lower() or signal == "buy_signal":
+        closes_str = ", ".join(f"{v:.0f}" for v in closes[-5:])
+        last_ma5 = round(last_ma5, 2)
+        last_ma20 = round(last_ma20, 2)
+
+        summary = {
+            "closes": closes_str,
+            "ma5": last_ma5,
+            "ma20": last_ma20,
+            "sig": signal,
+            "price": current_price,
+        }
+        # 매수/매도는 이평 시그널로 즉시 결정하고, AI 의견은 백그라운드에서 사후 검증
+        if signal == "buy_signal":
             raw_buy_price = current_price * 0.99
             buy_price = adjust_price_to_tick(raw_buy_price)
             volume = 0.0001
 
             order = buy_coin(market, buy_price, volume)
             if order:
-                reason_text = f"AI 의견/이평 시그널: 매수. Reason: {ai_opinion}"
+                reason_text = f"이평 시그널: 매수 (ma5={last_ma5}, ma20={last_ma20})"
                 insert_trade_log(conn, "BUY", market, volume, buy_price, reason_text)
+                _start_llm_review(conn, order, "BUY", market, volume, buy_price, summary)
 
-        elif "매도" in ai_opinion or "sell" in ai_opinion.lower() or signal == "sell_signal":
+        elif signal == "sell_signal":
             raw_sell_price = current_price * 1.01
             sell_price = adjust_price_to_tick(raw_sell_price)
             volume = 0.0001
 
             order = sell_coin(market, sell_price, volume)
             if order:
-                reason_text = f"AI 의견/이평 시그널: 매도. Reason: {ai_opinion}"
+                reason_text = f"이평 시그널: 매도 (ma5={last_ma5}, ma20={last_ma20})"
                 insert_trade_log(conn, "SELL", market, volume, sell_price, reason_text)
+                _start_llm_review(conn, order, "SELL", market, volume, sell_price, summary)
 
     except Exception as e:
-        print("[오류 in trade_once]", e)
+        logger.error("오류 in trade_once: %s", e)
+
+# AI 의견에서 매수/매도 키워드 판별용 정규식 (lower() 복사 없이 한 번만 스캔)
+_BUY_RE = re.compile(r"매수|buy", re.IGNORECASE)
+_SELL_RE = re.compile(r"매도|sell", re.IGNORECASE)
+
+def _llm_review(conn, order, action, market, volume, price, summary):
+    """백그라운드에서 AI 의견을 받아 주문을 확정하거나 취소"""
+    ai_opinion = run_async(get_investment_opinion(**summary))
+    if ai_opinion is None:
+        logger.warning("AI 의견 조회 실패, 주문 유지")
+        return
+
+    logger.info("AI Opinion: %s", ai_opinion)
+
+    if action == "BUY":
+        disagree = _SELL_RE.search(ai_opinion) is not None
+    else:
+        disagree = _BUY_RE.search(ai_opinion) is not None
+
+    if disagree and cancel_order(order.get("uuid")):
+        reason_text = f"AI 의견이 {action}와 불일치하여 취소. Reason: {ai_opinion}"
+        insert_trade_log(conn, "CANCEL", market, volume, price, reason_text)
+
+def _start_llm_review(conn, order, action, market, volume, price, summary):
+    t = threading.Thread(
+        target=_llm_review,
+        args=(conn, order, action, market, volume, price, summary),
+        daemon=True,
+    )
+    t.start()
+    return t
 
 # -----------------------------------------------------------------------------
 # 7. schedule 라이브러리를 이용해서 9시, 14시, 20시에 trade_once 실행
@@ -226,17 +496,26 @@ def main():
     schedule 라이브러리를 이용해 매일 09:00, 14:00, 20:00에
     trade_once를 자동으로 실행하는 예시
     """
+    # 웹소켓 ticker 피드 시작 (현재가는 푸시로 수신, REST는 OHLCV 갱신용으로만 사용)
+    start_ticker_feed("KRW-BTC")
+
+    # DB 커넥션은 한 번만 열고 매 실행마다 재사용
+    conn = init_db("trade_log.db")
+
     # "KRW-BTC"를 대상, interval="day", count=30
-    schedule.every().day.at("09:00").do(trade_once, "KRW-BTC", "day", 30)
-    schedule.every().day.at("14:00").do(trade_once, "KRW-BTC", "day", 30)
-    schedule.every().day.at("20:00").do(trade_once, "KRW-BTC", "day", 30)
-    trade_once()
-    print("Scheduler started! Running pending jobs... (Ctrl+C to stop)")
+    schedule.every().day.at("09:00").do(trade_once, conn, "KRW-BTC", "day", 30)
+    schedule.every().day.at("14:00").do(trade_once, conn, "KRW-BTC", "day", 30)
+    schedule.every().day.at("20:00").do(trade_once, conn, "KRW-BTC", "day", 30)
+    trade_once(conn)
+    logger.info("Scheduler started! Running pending jobs... (Ctrl+C to stop)")
 
     while True:
-        # 스케줄된 작업(run_pending)들을 체크해서, 실행 시간이 되면 수행
+        # 다음 작업까지 남은 시간만큼 잠들었다가 실행 (1초마다 깨어나는 폴링 제거)
+        idle = schedule.idle_seconds()
+        if idle is None:
+            break
+        time.sleep(max(1, idle))
         schedule.run_pending()
-        time.sleep(1)
 
 
 if __name__ == "__main__":